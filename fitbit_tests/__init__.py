@@ -5,6 +5,7 @@ from .test_api import (
     APITest,
     CollectionResourceTest,
     DeleteCollectionResourceTest,
+    CurriedResourceTest,
     ResourceAccessTest,
     SubscriptionsTest,
     PartnerAPITest
@@ -18,6 +19,7 @@ def all_tests(consumer_key="", consumer_secret="", user_key=None, user_secret=No
     suite.addTest(unittest.makeSuite(APITest))
     suite.addTest(unittest.makeSuite(CollectionResourceTest))
     suite.addTest(unittest.makeSuite(DeleteCollectionResourceTest))
+    suite.addTest(unittest.makeSuite(CurriedResourceTest))
     suite.addTest(unittest.makeSuite(ResourceAccessTest))
     suite.addTest(unittest.makeSuite(SubscriptionsTest))
     suite.addTest(unittest.makeSuite(PartnerAPITest))
@@ -1,44 +1,88 @@
 from unittest import TestCase
 import datetime
-import mock
+try:
+    from unittest import mock
+except ImportError:
+    # Python 2.x
+    import mock
 import requests
 from fitbit import Fitbit
 from fitbit.exceptions import DeleteError, Timeout
 
-URLBASE = "%s/%s/user" % (Fitbit.API_ENDPOINT, Fitbit.API_VERSION)
+# Fitbit objects default to US units
+SYSTEM = Fitbit.US
+
+API_URL = "%s/%s" % (Fitbit.API_ENDPOINT, Fitbit.API_VERSION)
+URLBASE = API_URL + "/user"
+
+
+class _Recorder(object):
+    """
+    A bare-bones stand-in for a mocked callable that remembers how it was
+    last called and returns ``retval``
+    """
+    call_args = None
+    call_count = 0
+
+    def __init__(self, retval=None):
+        self.retval = retval
+
+    def __call__(self, *args, **kwargs):
+        self.call_args = (args, kwargs)
+        self.call_count += 1
+        return self.retval
+
+
+class _Response(object):
+    """ The only parts of a requests response that the code under test reads """
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
 
 
 class TestBase(TestCase):
-    def setUp(self):
-        self.fb = Fitbit('x', 'y')
+    @classmethod
+    def setUpClass(cls):
+        # The tests never change the Fitbit object's state, so one instance
+        # (and one run of its curry-heavy __init__) is shared per class
+        cls.fb = Fitbit('x', 'y')
 
     def common_api_test(self, funcname, args, kwargs, expected_args, expected_kwargs):
         # Create a fitbit object, call the named function on it with the given
         # arguments and verify that make_request is called with the expected args and kwargs
-        with mock.patch.object(self.fb, 'make_request') as make_request:
-            retval = getattr(self.fb, funcname)(*args, **kwargs)
-        mr_args, mr_kwargs = make_request.call_args
+        func = getattr(self.fb, funcname)
+        mr_args, mr_kwargs = self.record_make_request(func, *args, **kwargs)
         self.assertEqual(expected_args, mr_args)
         self.assertEqual(expected_kwargs, mr_kwargs)
 
+    def record_make_request(self, func, *args, **kwargs):
+        # Call func with self.fb.make_request swapped out for a recorder and
+        # return the (args, kwargs) that make_request was called with
+        make_request = _Recorder()
+        self.fb.make_request = make_request
+        try:
+            func(*args, **kwargs)
+        finally:
+            del self.fb.make_request
+        return make_request.call_args
+
     def verify_raises(self, funcname, args, kwargs, exc):
         self.assertRaises(exc, getattr(self.fb, funcname), *args, **kwargs)
 
 
 class TimeoutTest(TestCase):
 
-    def setUp(self):
-        self.fb = Fitbit('x', 'y')
-        self.fb_timeout = Fitbit('x', 'y', timeout=10)
+    @classmethod
+    def setUpClass(cls):
+        cls.fb = Fitbit('x', 'y')
+        cls.fb_timeout = Fitbit('x', 'y', timeout=10)
 
-        self.test_url = 'invalid://do.not.connect'
+        cls.test_url = 'invalid://do.not.connect'
 
     def test_fb_without_timeout(self):
-        with mock.patch.object(self.fb.client.session, 'request') as request:
-            mock_response = mock.Mock()
-            mock_response.status_code = 200
-            mock_response.content = b'{}'
-            request.return_value = mock_response
+        mock_response = _Response(200, b'{}')
+        with mock.patch.object(self.fb.client.session, 'request',
+                               new=mock.Mock(return_value=mock_response)) as request:
             result = self.fb.make_request(self.test_url)
 
         request.assert_called_once()
@@ -46,8 +90,8 @@ class TimeoutTest(TestCase):
         self.assertEqual({}, result)
 
     def test_fb_with_timeout__timing_out(self):
-        with mock.patch.object(self.fb_timeout.client.session, 'request') as request:
-            request.side_effect = requests.Timeout('Timed out')
+        with mock.patch.object(self.fb_timeout.client.session, 'request',
+                               new=mock.Mock(side_effect=requests.Timeout('Timed out'))) as request:
             with self.assertRaisesRegexp(Timeout, 'Timed out'):
                 self.fb_timeout.make_request(self.test_url)
 
@@ -55,12 +99,9 @@ class TimeoutTest(TestCase):
         self.assertEqual(10, request.call_args[1]['timeout'])
 
     def test_fb_with_timeout__not_timing_out(self):
-        with mock.patch.object(self.fb_timeout.client.session, 'request') as request:
-            mock_response = mock.Mock()
-            mock_response.status_code = 200
-            mock_response.content = b'{}'
-            request.return_value = mock_response
-
+        mock_response = _Response(200, b'{}')
+        with mock.patch.object(self.fb_timeout.client.session, 'request',
+                               new=mock.Mock(return_value=mock_response)) as request:
             result = self.fb_timeout.make_request(self.test_url)
 
         request.assert_called_once()
@@ -73,71 +114,70 @@ class APITest(TestBase):
     Tests for python-fitbit API, not directly involved in getting
     authenticated
     """
+    ARGS = (1, 2)
+
+    def setUp(self):
+        self.client_make_request = _Recorder()
+        self.fb.client.make_request = self.client_make_request
+
+    def tearDown(self):
+        del self.fb.client.make_request
+
+    def _make_request(self, status_code, content, **kwargs):
+        # Have the client respond with the given status code and content,
+        # then call make_request with ARGS and the given kwargs
+        self.client_make_request.retval = _Response(status_code, content)
+        return self.fb.make_request(*self.ARGS, **kwargs)
 
     def test_make_request(self):
         # If make_request returns a response with status 200,
         # we get back the json decoded value that was in the response.content
-        ARGS = (1, 2)
-        KWARGS = {'a': 3, 'b': 4, 'headers': {'Accept-Language': self.fb.system}}
-        mock_response = mock.Mock()
-        mock_response.status_code = 200
-        mock_response.content = b"1"
-        with mock.patch.object(self.fb.client, 'make_request') as client_make_request:
-            client_make_request.return_value = mock_response
-            retval = self.fb.make_request(*ARGS, **KWARGS)
-        self.assertEqual(1, client_make_request.call_count)
+        KWARGS = {'a': 3, 'b': 4, 'headers': {'Accept-Language': SYSTEM}}
+        retval = self._make_request(200, b"1", **KWARGS)
+        self.assertEqual(1, self.client_make_request.call_count)
         self.assertEqual(1, retval)
-        args, kwargs = client_make_request.call_args
-        self.assertEqual(ARGS, args)
+        args, kwargs = self.client_make_request.call_args
+        self.assertEqual(self.ARGS, args)
         self.assertEqual(KWARGS, kwargs)
 
     def test_make_request_202(self):
         # If make_request returns a response with status 202,
         # we get back True
-        mock_response = mock.Mock()
-        mock_response.status_code = 202
-        mock_response.content = "1"
-        ARGS = (1, 2)
-        KWARGS = {'a': 3, 'b': 4, 'Accept-Language': self.fb.system}
-        with mock.patch.object(self.fb.client, 'make_request') as client_make_request:
-            client_make_request.return_value = mock_response
-            retval = self.fb.make_request(*ARGS, **KWARGS)
+        KWARGS = {'a': 3, 'b': 4, 'Accept-Language': SYSTEM}
+        retval = self._make_request(202, "1", **KWARGS)
         self.assertEqual(True, retval)
 
     def test_make_request_delete_204(self):
         # If make_request returns a response with status 204,
         # and the method is DELETE, we get back True
-        mock_response = mock.Mock()
-        mock_response.status_code = 204
-        mock_response.content = "1"
-        ARGS = (1, 2)
-        KWARGS = {'a': 3, 'b': 4, 'method': 'DELETE', 'Accept-Language': self.fb.system}
-        with mock.patch.object(self.fb.client, 'make_request') as client_make_request:
-            client_make_request.return_value = mock_response
-            retval = self.fb.make_request(*ARGS, **KWARGS)
+        KWARGS = {'a': 3, 'b': 4, 'method': 'DELETE', 'Accept-Language': SYSTEM}
+        retval = self._make_request(204, "1", **KWARGS)
         self.assertEqual(True, retval)
 
     def test_make_request_delete_not_204(self):
         # If make_request returns a response with status not 204,
         # and the method is DELETE, DeleteError is raised
-        mock_response = mock.Mock()
-        mock_response.status_code = 205
-        mock_response.content = "1"
-        ARGS = (1, 2)
-        KWARGS = {'a': 3, 'b': 4, 'method': 'DELETE', 'Accept-Language': self.fb.system}
-        with mock.patch.object(self.fb.client, 'make_request') as client_make_request:
-            client_make_request.return_value = mock_response
-            self.assertRaises(DeleteError, self.fb.make_request, *ARGS, **KWARGS)
+        KWARGS = {'a': 3, 'b': 4, 'method': 'DELETE', 'Accept-Language': SYSTEM}
+        try:
+            self._make_request(205, "1", **KWARGS)
+        except DeleteError:
+            pass
+        else:
+            self.fail("DeleteError not raised")
 
 
 class CollectionResourceTest(TestBase):
     """ Tests for _COLLECTION_RESOURCE """
+    DATE = datetime.date(1962, 1, 13)
+    # _COLLECTION_RESOURCE adds the date to data, so tests work on a copy
+    DATA = {'a': 1, 'b': 2}
+
     def test_all_args(self):
         # If we pass all the optional args, the right things happen
         resource = "RESOURCE"
-        date = datetime.date(1962, 1, 13)
+        date = self.DATE
         user_id = "bilbo"
-        data = {'a': 1, 'b': 2}
+        data = dict(self.DATA)
         expected_data = data.copy()
         expected_data['date'] = date.strftime("%Y-%m-%d")
         url = URLBASE + "/%s/%s.json" % (user_id, resource)
@@ -148,7 +188,7 @@ class CollectionResourceTest(TestBase):
         resource = "RESOURCE"
         date = "1962-1-13"
         user_id = "bilbo"
-        data = {'a': 1, 'b': 2}
+        data = dict(self.DATA)
         expected_data = data.copy()
         expected_data['date'] = date
         url = URLBASE + "/%s/%s.json" % (user_id, resource)
@@ -158,7 +198,7 @@ class CollectionResourceTest(TestBase):
         # If we omit the date, it uses today
         resource = "RESOURCE"
         user_id = "bilbo"
-        data = {'a': 1, 'b': 2}
+        data = dict(self.DATA)
         expected_data = data.copy()
         expected_data['date'] = datetime.date.today().strftime("%Y-%m-%d")  # expect today
         url = URLBASE + "/%s/%s.json" % (user_id, resource)
@@ -167,9 +207,9 @@ class CollectionResourceTest(TestBase):
     def test_no_userid(self):
         # If we omit the user_id, it uses "-"
         resource = "RESOURCE"
-        date = datetime.date(1962, 1, 13)
+        date = self.DATE
         user_id = None
-        data = {'a': 1, 'b': 2}
+        data = dict(self.DATA)
         expected_data = data.copy()
         expected_data['date'] = date.strftime("%Y-%m-%d")
         expected_user_id = "-"
@@ -184,28 +224,12 @@ class CollectionResourceTest(TestBase):
     def test_no_data(self):
         # If we omit the data arg, it does the right thing
         resource = "RESOURCE"
-        date = datetime.date(1962, 1, 13)
+        date = self.DATE
         user_id = "bilbo"
         data = None
         url = URLBASE + "/%s/%s/date/%s.json" % (user_id, resource, date)
         self.common_api_test('_COLLECTION_RESOURCE', (resource, date, user_id, data), {}, (url, data), {})
 
-    def test_body(self):
-        # Test the first method defined in __init__ to see if it calls
-        # _COLLECTION_RESOURCE okay - if it does, they should all since
-        # they're all built the same way
-
-        # We need to mock _COLLECTION_RESOURCE before we create the Fitbit object,
-        # since the __init__ is going to set up references to it
-        with mock.patch('fitbit.api.Fitbit._COLLECTION_RESOURCE') as coll_resource:
-            coll_resource.return_value = 999
-            fb = Fitbit('x', 'y')
-            retval = fb.body(date=1, user_id=2, data=3)
-        args, kwargs = coll_resource.call_args
-        self.assertEqual(('body',), args)
-        self.assertEqual({'date': 1, 'user_id': 2, 'data': 3}, kwargs)
-        self.assertEqual(999, retval)
-
 
 class DeleteCollectionResourceTest(TestBase):
     """Tests for _DELETE_COLLECTION_RESOURCE"""
@@ -224,28 +248,65 @@ class DeleteCollectionResourceTest(TestBase):
     def test_cant_delete_body(self):
         self.assertFalse(hasattr(self.fb, 'delete_body'))
 
+
+class CurriedResourceTest(TestCase):
+    """
+    Tests for the per-resource methods that __init__ curries from
+    _COLLECTION_RESOURCE and _DELETE_COLLECTION_RESOURCE
+    """
+    @classmethod
+    def setUpClass(cls):
+        # We need to mock both methods before we create the Fitbit object,
+        # since the __init__ is going to set up references to them
+        cls._coll_patcher = mock.patch(
+            'fitbit.api.Fitbit._COLLECTION_RESOURCE', new=mock.Mock())
+        cls._delete_patcher = mock.patch(
+            'fitbit.api.Fitbit._DELETE_COLLECTION_RESOURCE', new=mock.Mock())
+        cls._coll_mock = cls._coll_patcher.start()
+        started = [cls._coll_patcher]
+        try:
+            cls._delete_mock = cls._delete_patcher.start()
+            started.append(cls._delete_patcher)
+            cls.fb = Fitbit('x', 'y')
+        except Exception:
+            # tearDownClass doesn't run if setUpClass fails, so undo the
+            # patches here rather than leave Fitbit patched for later tests
+            for patcher in reversed(started):
+                patcher.stop()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._delete_patcher.stop()
+        cls._coll_patcher.stop()
+
+    def setUp(self):
+        for resource_mock in (self._coll_mock, self._delete_mock):
+            resource_mock.reset_mock()
+            resource_mock.return_value = 999
+
+    def test_body(self):
+        # Test the first method defined in __init__ to see if it calls
+        # _COLLECTION_RESOURCE okay - if it does, they should all since
+        # they're all built the same way
+        retval = self.fb.body(date=1, user_id=2, data=3)
+        args, kwargs = self._coll_mock.call_args
+        self.assertEqual(('body',), args)
+        self.assertEqual({'date': 1, 'user_id': 2, 'data': 3}, kwargs)
+        self.assertEqual(999, retval)
+
     def test_delete_foods_log(self):
         log_id = "fake_log_id"
-        # We need to mock _DELETE_COLLECTION_RESOURCE before we create the Fitbit object,
-        # since the __init__ is going to set up references to it
-        with mock.patch('fitbit.api.Fitbit._DELETE_COLLECTION_RESOURCE') as delete_resource:
-            delete_resource.return_value = 999
-            fb = Fitbit('x', 'y')
-            retval = fb.delete_foods_log(log_id=log_id)
-        args, kwargs = delete_resource.call_args
+        retval = self.fb.delete_foods_log(log_id=log_id)
+        args, kwargs = self._delete_mock.call_args
         self.assertEqual(('foods/log',), args)
         self.assertEqual({'log_id': log_id}, kwargs)
         self.assertEqual(999, retval)
 
     def test_delete_foods_log_water(self):
         log_id = "OmarKhayyam"
-        # We need to mock _DELETE_COLLECTION_RESOURCE before we create the Fitbit object,
-        # since the __init__ is going to set up references to it
-        with mock.patch('fitbit.api.Fitbit._DELETE_COLLECTION_RESOURCE') as delete_resource:
-            delete_resource.return_value = 999
-            fb = Fitbit('x', 'y')
-            retval = fb.delete_foods_log_water(log_id=log_id)
-        args, kwargs = delete_resource.call_args
+        retval = self.fb.delete_foods_log_water(log_id=log_id)
+        args, kwargs = self._delete_mock.call_args
         self.assertEqual(('foods/log/water',), args)
         self.assertEqual({'log_id': log_id}, kwargs)
         self.assertEqual(999, retval)
@@ -256,6 +317,10 @@ class ResourceAccessTest(TestBase):
     Class for testing the Fitbit Resource Access API:
     https://dev.fitbit.com/docs/
     """
+    BASE_DATE = datetime.date(1992, 5, 12)
+    END_DATE = datetime.date(1998, 12, 31)
+    ALARM_TIME = datetime.datetime(year=2013, month=11, day=13, hour=8, minute=16)
+
     def test_user_profile_get(self):
         """
         Test getting a user profile.
@@ -285,7 +350,7 @@ class ResourceAccessTest(TestBase):
 
     def test_recent_activities(self):
         user_id = "LukeSkywalker"
-        with mock.patch('fitbit.api.Fitbit.activity_stats') as act_stats:
+        with mock.patch('fitbit.api.Fitbit.activity_stats', new=mock.Mock()) as act_stats:
             fb = Fitbit('x', 'y')
             retval = fb.recent_activities(user_id=user_id)
         args, kwargs = act_stats.call_args
@@ -377,39 +442,35 @@ class ResourceAccessTest(TestBase):
         end_date = '1998-12-31'
 
         # Not allowed to specify both period and end date
-        self.assertRaises(
-            TypeError,
-            self.fb.time_series,
-            resource,
-            user_id,
-            base_date,
-            period,
-            end_date)
+        try:
+            self.fb.time_series(resource, user_id, base_date, period, end_date)
+        except TypeError:
+            pass
+        else:
+            self.fail("TypeError not raised")
 
         # Period must be valid
-        self.assertRaises(
-            ValueError,
-            self.fb.time_series,
-            resource,
-            user_id,
-            base_date,
-            period="xyz",
-            end_date=None)
+        try:
+            self.fb.time_series(
+                resource, user_id, base_date, period="xyz", end_date=None)
+        except ValueError:
+            pass
+        else:
+            self.fail("ValueError not raised")
 
         def test_timeseries(fb, resource, user_id, base_date, period, end_date, expected_url):
-            with mock.patch.object(fb, 'make_request') as make_request:
-                retval = fb.time_series(resource, user_id, base_date, period, end_date)
-            args, kwargs = make_request.call_args
+            args, kwargs = self.record_make_request(
+                fb.time_series, resource, user_id, base_date, period, end_date)
             self.assertEqual((expected_url,), args)
 
         # User_id defaults = "-"
         test_timeseries(self.fb, resource, user_id=None, base_date=base_date, period=period, end_date=None,
             expected_url=URLBASE + "/-/FOO/date/1992-05-12/1d.json")
         # end_date can be a date object
-        test_timeseries(self.fb, resource, user_id=user_id, base_date=base_date, period=None, end_date=datetime.date(1998, 12, 31),
+        test_timeseries(self.fb, resource, user_id=user_id, base_date=base_date, period=None, end_date=self.END_DATE,
             expected_url=URLBASE + "/BAR/FOO/date/1992-05-12/1998-12-31.json")
         # base_date can be a date object
-        test_timeseries(self.fb, resource, user_id=user_id, base_date=datetime.date(1992,5,12), period=None, end_date=end_date,
+        test_timeseries(self.fb, resource, user_id=user_id, base_date=self.BASE_DATE, period=None, end_date=end_date,
             expected_url=URLBASE + "/BAR/FOO/date/1992-05-12/1998-12-31.json")
 
     def test_sleep(self):
@@ -436,11 +497,11 @@ class ResourceAccessTest(TestBase):
         self.common_api_test('create_food', (), {'data': 'FOO'}, (url,), {'data': 'FOO'})
         url = URLBASE + "/-/meals.json"
         self.common_api_test('get_meals', (), {}, (url,), {})
-        url = "%s/%s/foods/search.json?query=FOOBAR" % (Fitbit.API_ENDPOINT, Fitbit.API_VERSION)
+        url = API_URL + "/foods/search.json?query=FOOBAR"
         self.common_api_test('search_foods', ("FOOBAR",), {}, (url,), {})
-        url = "%s/%s/foods/FOOBAR.json" % (Fitbit.API_ENDPOINT, Fitbit.API_VERSION)
+        url = API_URL + "/foods/FOOBAR.json"
         self.common_api_test('food_detail', ("FOOBAR",), {}, (url,), {})
-        url = "%s/%s/foods/units.json" % (Fitbit.API_ENDPOINT, Fitbit.API_VERSION)
+        url = API_URL + "/foods/units.json"
         self.common_api_test('food_units', (), {}, (url,), {})
 
     def test_devices(self):
@@ -462,11 +523,11 @@ class ResourceAccessTest(TestBase):
         POST https://api.fitbit.com/1/user/-/activities/favorite/activity_id.json
         DELETE https://api.fitbit.com/1/user/-/activities/favorite/activity_id.json
         """
-        url = "%s/%s/activities.json" % (Fitbit.API_ENDPOINT, Fitbit.API_VERSION)
+        url = API_URL + "/activities.json"
         self.common_api_test('activities_list', (), {}, (url,), {})
-        url = "%s/%s/user/-/activities.json" % (Fitbit.API_ENDPOINT, Fitbit.API_VERSION)
+        url = URLBASE + "/-/activities.json"
         self.common_api_test('log_activity', (), {'data' : 'FOO'}, (url,), {'data' : 'FOO'} )
-        url = "%s/%s/activities/FOOBAR.json" % (Fitbit.API_ENDPOINT, Fitbit.API_VERSION)
+        url = API_URL + "/activities/FOOBAR.json"
         self.common_api_test('activity_detail', ("FOOBAR",), {}, (url,), {})
 
         url = URLBASE + "/-/activities/favorite/activity_id.json"
@@ -476,10 +537,9 @@ class ResourceAccessTest(TestBase):
     def _test_get_bodyweight(self, base_date=None, user_id=None, period=None,
                              end_date=None, expected_url=None):
         """ Helper method for testing retrieving body weight measurements """
-        with mock.patch.object(self.fb, 'make_request') as make_request:
-            self.fb.get_bodyweight(base_date, user_id=user_id, period=period,
-                                   end_date=end_date)
-        args, kwargs = make_request.call_args
+        args, kwargs = self.record_make_request(
+            self.fb.get_bodyweight, base_date, user_id=user_id, period=period,
+            end_date=end_date)
         self.assertEqual((expected_url,), args)
 
     def test_bodyweight(self):
@@ -496,17 +556,17 @@ class ResourceAccessTest(TestBase):
 
         # No end_date or period
         self._test_get_bodyweight(
-            base_date=datetime.date(1992, 5, 12), user_id=None, period=None,
+            base_date=self.BASE_DATE, user_id=None, period=None,
             end_date=None,
             expected_url=URLBASE + "/-/body/log/weight/date/1992-05-12.json")
         # With end_date
         self._test_get_bodyweight(
-            base_date=datetime.date(1992, 5, 12), user_id=user_id, period=None,
-            end_date=datetime.date(1998, 12, 31),
+            base_date=self.BASE_DATE, user_id=user_id, period=None,
+            end_date=self.END_DATE,
             expected_url=URLBASE + "/BAR/body/log/weight/date/1992-05-12/1998-12-31.json")
         # With period
         self._test_get_bodyweight(
-            base_date=datetime.date(1992, 5, 12), user_id=user_id, period="1d",
+            base_date=self.BASE_DATE, user_id=user_id, period="1d",
             end_date=None,
             expected_url=URLBASE + "/BAR/body/log/weight/date/1992-05-12/1d.json")
         # Date defaults to today
@@ -518,10 +578,9 @@ class ResourceAccessTest(TestBase):
     def _test_get_bodyfat(self, base_date=None, user_id=None, period=None,
                           end_date=None, expected_url=None):
         """ Helper method for testing getting bodyfat measurements """
-        with mock.patch.object(self.fb, 'make_request') as make_request:
-            self.fb.get_bodyfat(base_date, user_id=user_id, period=period,
-                                end_date=end_date)
-        args, kwargs = make_request.call_args
+        args, kwargs = self.record_make_request(
+            self.fb.get_bodyfat, base_date, user_id=user_id, period=period,
+            end_date=end_date)
         self.assertEqual((expected_url,), args)
 
     def test_bodyfat(self):
@@ -538,17 +597,17 @@ class ResourceAccessTest(TestBase):
 
         # No end_date or period
         self._test_get_bodyfat(
-            base_date=datetime.date(1992, 5, 12), user_id=None, period=None,
+            base_date=self.BASE_DATE, user_id=None, period=None,
             end_date=None,
             expected_url=URLBASE + "/-/body/log/fat/date/1992-05-12.json")
         # With end_date
         self._test_get_bodyfat(
-            base_date=datetime.date(1992, 5, 12), user_id=user_id, period=None,
-            end_date=datetime.date(1998, 12, 31),
+            base_date=self.BASE_DATE, user_id=user_id, period=None,
+            end_date=self.END_DATE,
             expected_url=URLBASE + "/BAR/body/log/fat/date/1992-05-12/1998-12-31.json")
         # With period
         self._test_get_bodyfat(
-            base_date=datetime.date(1992, 5, 12), user_id=user_id, period="1d",
+            base_date=self.BASE_DATE, user_id=user_id, period="1d",
             end_date=None,
             expected_url=URLBASE + "/BAR/body/log/fat/date/1992-05-12/1d.json")
         # Date defaults to today
@@ -589,14 +648,14 @@ class ResourceAccessTest(TestBase):
         self.common_api_test('add_alarm',
             (),
             {'device_id': 'FOO',
-             'alarm_time': datetime.datetime(year=2013, month=11, day=13, hour=8, minute=16),
+             'alarm_time': self.ALARM_TIME,
              'week_days': ['MONDAY']
             },
             (url,),
             {'data':
                  {'enabled': True,
                     'recurring': False,
-                    'time': datetime.datetime(year=2013, month=11, day=13, hour=8, minute=16).strftime("%H:%M%z"),
+                    'time': self.ALARM_TIME.strftime("%H:%M%z"),
                     'vibe': 'DEFAULT',
                     'weekDays': ['MONDAY'],
                 },
@@ -606,7 +665,7 @@ class ResourceAccessTest(TestBase):
         self.common_api_test('add_alarm',
             (),
             {'device_id': 'FOO',
-             'alarm_time': datetime.datetime(year=2013, month=11, day=13, hour=8, minute=16),
+             'alarm_time': self.ALARM_TIME,
              'week_days': ['MONDAY'], 'recurring': True, 'enabled': False, 'label': 'ugh',
              'snooze_length': 5,
              'snooze_count': 5
@@ -618,7 +677,7 @@ class ResourceAccessTest(TestBase):
                   'label': 'ugh',
                   'snoozeLength': 5,
                   'snoozeCount': 5,
-                  'time': datetime.datetime(year=2013, month=11, day=13, hour=8, minute=16).strftime("%H:%M%z"),
+                  'time': self.ALARM_TIME.strftime("%H:%M%z"),
                   'vibe': 'DEFAULT',
                   'weekDays': ['MONDAY'],
                 },
@@ -629,7 +688,7 @@ class ResourceAccessTest(TestBase):
             (),
             {'device_id': 'FOO',
              'alarm_id': 'BAR',
-             'alarm_time': datetime.datetime(year=2013, month=11, day=13, hour=8, minute=16),
+             'alarm_time': self.ALARM_TIME,
              'week_days': ['MONDAY'], 'recurring': True, 'enabled': False, 'label': 'ugh',
              'snooze_length': 5,
              'snooze_count': 5
@@ -641,7 +700,7 @@ class ResourceAccessTest(TestBase):
                   'label': 'ugh',
                   'snoozeLength': 5,
                   'snoozeCount': 5,
-                  'time': datetime.datetime(year=2013, month=11, day=13, hour=8, minute=16).strftime("%H:%M%z"),
+                  'time': self.ALARM_TIME.strftime("%H:%M%z"),
                   'vibe': 'DEFAULT',
                   'weekDays': ['MONDAY'],
                 },
@@ -687,10 +746,9 @@ class PartnerAPITest(TestBase):
     def _test_intraday_timeseries(self, resource, base_date, detail_level,
                                   start_time, end_time, expected_url):
         """ Helper method for intraday timeseries tests """
-        with mock.patch.object(self.fb, 'make_request') as make_request:
-            retval = self.fb.intraday_time_series(
-                resource, base_date, detail_level, start_time, end_time)
-        args, kwargs = make_request.call_args
+        args, kwargs = self.record_make_request(
+            self.fb.intraday_time_series,
+            resource, base_date, detail_level, start_time, end_time)
         self.assertEqual((expected_url,), args)
 
     def test_intraday_timeseries(self):
@@ -1,6 +1,10 @@
 import copy
 import json
-import mock
+try:
+    from unittest import mock
+except ImportError:
+    # Python 2.x
+    import mock
 import requests_mock
 
 from datetime import datetime
@@ -1,6 +1,10 @@
 import unittest
 import json
-import mock
+try:
+    from unittest import mock
+except ImportError:
+    # Python 2.x
+    import mock
 import requests
 import sys
 from fitbit import Fitbit